@@ -13,13 +13,20 @@ Output:
     ASCII/scene_name.txt
 """
 
+import gzip
+import io
 import os
+import queue
+import re
 import sys
+import threading
+from functools import partial
 
 sys.path.insert(0, os.path.dirname(__file__))
 
 import bpy
 import mathutils
+import numpy as np
 from models import (
     Camera,
     Color,
@@ -35,224 +42,284 @@ from models import (
     Torus,
 )
 
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; Blender does not bundle it.
+    njit = None
+
+# Write ASCII/<scene>.txt.gz instead of plain text. The C++ loader cannot read
+# gzip, so only enable this for archiving or for a loader built with zlib.
+COMPRESS_OUTPUT = False
+
+# How find_texture_node walks through a node on its way to an image texture:
+# shader/mix nodes are followed through their colour and shader inputs,
+# colour/math utility nodes through any value-like input.
+_FOLLOW_NAMED_INPUTS = 1
+_FOLLOW_VALUE_INPUTS = 2
+_TEXTURE_PASSTHROUGH = {
+    "MIX_RGB": _FOLLOW_NAMED_INPUTS,
+    "MIX_SHADER": _FOLLOW_NAMED_INPUTS,
+    "ADD_SHADER": _FOLLOW_NAMED_INPUTS,
+    "BSDF_DIFFUSE": _FOLLOW_NAMED_INPUTS,
+    "BSDF_GLOSSY": _FOLLOW_NAMED_INPUTS,
+    "VALTORGB": _FOLLOW_VALUE_INPUTS,
+    "GAMMA": _FOLLOW_VALUE_INPUTS,
+    "HUE_SAT": _FOLLOW_VALUE_INPUTS,
+    "BRIGHTCONTRAST": _FOLLOW_VALUE_INPUTS,
+    "INVERT": _FOLLOW_VALUE_INPUTS,
+    "CURVES_RGB": _FOLLOW_VALUE_INPUTS,
+    "MATH": _FOLLOW_VALUE_INPUTS,
+    "VECT_MATH": _FOLLOW_VALUE_INPUTS,
+}
+_PASSTHROUGH_INPUT_NAMES = ("Color", "Color1", "Color2", "Base Color", "Shader")
+_VALUE_SOCKET_TYPES = frozenset(("RGBA", "VECTOR", "VALUE"))
+
+
+# Below this many vertices the NumPy matmul beats the JIT's thread start-up.
+_JIT_MIN_POINTS = 4096
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _transform_points_jit(transform, coords):
+        out = np.empty_like(coords)
+        for i in prange(coords.shape[0]):
+            x, y, z = coords[i, 0], coords[i, 1], coords[i, 2]
+            for row in range(3):
+                out[i, row] = (
+                    transform[row, 0] * x
+                    + transform[row, 1] * y
+                    + transform[row, 2] * z
+                    + transform[row, 3]
+                )
+        return out
+
+else:
+    _transform_points_jit = None
+
+
+def transform_points(transform, coords):
+    """Apply a 4x4 affine transform to an (N, 3) array of points."""
+    if _transform_points_jit is not None and len(coords) >= _JIT_MIN_POINTS:
+        return _transform_points_jit(transform, coords)
+    return coords @ transform[:3, :3].T + transform[:3, 3]
+
+
+def roughness_to_shininess(roughness: float) -> float:
+    """Map Blender roughness to a Blinn-Phong shininess exponent.
+
+    Uses a smoother, non-linear mapping to get softer highlights:
+    roughness 0.0 -> shininess ~120, 0.5 -> ~21, 1.0 -> 1 (very rough).
+    """
+    return max(1.0, pow(1.0 - roughness, 2.5) * 120.0)
+
+
+def find_texture_node(socket, origin):
+    """Find the image texture feeding `socket`, looking through mix/colour nodes.
+
+    `origin` maps each linked input socket to the node that drives it.
+    """
+    node = origin.get(socket)
+    if node is None:
+        return None
+
+    # Iterative depth-first search; inputs are pushed in reverse so they are
+    # explored in socket order, first match wins.
+    stack = [node]
+    visited = set()
+    while stack:
+        n = stack.pop()
+        if n in visited:
+            continue
+        visited.add(n)
+
+        node_type = n.type
+        if node_type == "TEX_IMAGE":
+            return n
+
+        follow = _TEXTURE_PASSTHROUGH.get(node_type)
+        if follow == _FOLLOW_NAMED_INPUTS:
+            inputs = n.inputs
+            sources = [
+                origin.get(inputs.get(name)) for name in _PASSTHROUGH_INPUT_NAMES
+            ]
+        elif follow == _FOLLOW_VALUE_INPUTS:
+            sources = [
+                origin.get(input_socket)
+                for input_socket in n.inputs
+                if input_socket.type in _VALUE_SOCKET_TYPES
+            ]
+        else:
+            continue
+        stack.extend(source for source in reversed(sources) if source is not None)
+    return None
+
+
+# Exported materials keyed by Blender material name (or by object colour when
+# no material is assigned). Objects sharing a material reuse one instance.
+_material_cache = {}
 
-def export_material(obj) -> Material:
-    """Extract material properties from Blender object."""
-    material = Material()
 
-    if not obj.material_slots or not obj.material_slots[0].material:
-        if hasattr(obj, "color") and (
-            obj.color[0] != 1.0 or obj.color[1] != 1.0 or obj.color[2] != 1.0
-        ):
-            material.diffuse_color = Color(obj.color[0], obj.color[1], obj.color[2])
+def export_material(obj) -> Material:
+    """Extract material properties from Blender object, memoized per material."""
+    mat = obj.material_slots[0].material if obj.material_slots else None
+    if mat:
+        key = mat.name_full
+    else:
+        # Logged here rather than in _build_material so every object reports,
+        # not just the first one to hit the cache.
+        color = obj.color[:3] if hasattr(obj, "color") else (1.0, 1.0, 1.0)
+        if color != (1.0, 1.0, 1.0):
             print(
-                f"  {obj.name}: Using object color RGB({obj.color[0]:.3f}, {obj.color[1]:.3f}, {obj.color[2]:.3f})"
+                f"  {obj.name}: Using object color RGB({color[0]:.3f}, {color[1]:.3f}, {color[2]:.3f})"
             )
         else:
             print(f"  {obj.name}: No material assigned (using default gray)")
-        return material
+        key = f"__color__{obj.color[:] if hasattr(obj, 'color') else None}"
 
-    mat = obj.material_slots[0].material
+    material = _material_cache.get(key)
+    if material is None:
+        material = _material_cache[key] = _build_material(obj, mat)
+    return material
 
-    if mat.use_nodes:
-        nodes = mat.node_tree.nodes
-        principled = None
-        diffuse_bsdf = None
-        glossy_bsdf = None
-        mix_shader = None
-        emission_node = None
-        glass_bsdf = None
-        refract_bsdf = None
 
-        for node in nodes:
-            if node.type == "BSDF_PRINCIPLED":
-                principled = node
-                break
-            elif node.type == "BSDF_DIFFUSE":
-                diffuse_bsdf = node
-            elif node.type == "BSDF_GLOSSY":
-                glossy_bsdf = node
-            elif node.type == "MIX_SHADER":
-                mix_shader = node
-            elif node.type == "EMISSION":
-                emission_node = node
-            elif node.type == "BSDF_GLASS":
-                glass_bsdf = node
-            elif node.type == "BSDF_REFRACTION":
-                refract_bsdf = node
-
-    def find_texture_node(socket):
-        if not socket.is_linked:
-            return None
-        node = socket.links[0].from_node
-        visited = set()
-
-        def traverse(n):
-            if n in visited:
-                return None
-            visited.add(n)
-
-            if n.type == "TEX_IMAGE":
-                return n
-
-            if n.type in [
-                "MIX_RGB",
-                "MIX_SHADER",
-                "ADD_SHADER",
-                "BSDF_DIFFUSE",
-                "BSDF_GLOSSY",
-            ]:
-                for input_name in ["Color", "Color1", "Color2", "Base Color", "Shader"]:
-                    if input_name in n.inputs and n.inputs[input_name].is_linked:
-                        res = traverse(n.inputs[input_name].links[0].from_node)
-                        if res:
-                            return res
-            elif n.type in [
-                "VALTORGB",
-                "GAMMA",
-                "HUE_SAT",
-                "BRIGHTCONTRAST",
-                "INVERT",
-                "CURVES_RGB",
-                "MATH",
-                "VECT_MATH",
-            ]:
-                for input_socket in n.inputs:
-                    if (
-                        input_socket.type in ["RGBA", "VECTOR", "VALUE"]
-                        and input_socket.is_linked
-                    ):
-                        res = traverse(input_socket.links[0].from_node)
-                        if res:
-                            return res
-            return None
-
-        return traverse(node)
+def _build_material(
+    obj,
+    mat,
+    # Bound as defaults so the body resolves them as locals, not globals.
+    Color=Color,
+    abspath=bpy.path.abspath,
+    basename=os.path.basename,
+) -> Material:
+    """Build a Material from the object's first material slot."""
+    material = Material()
 
-    if mat.use_nodes:
-        nodes = mat.node_tree.nodes
-        principled = None
-        diffuse_bsdf = None
-        glossy_bsdf = None
-        mix_shader = None
-        emission_node = None
-        glass_bsdf = None
-        refract_bsdf = None
+    if not mat:
+        # Slice once: each indexed read of a Blender colour is an RNA access.
+        color = obj.color[:3] if hasattr(obj, "color") else (1.0, 1.0, 1.0)
+        if color != (1.0, 1.0, 1.0):
+            material.diffuse_color = Color(*color)
+        return material
 
+    if mat.use_nodes:
+        node_tree = mat.node_tree
+        nodes = list(node_tree.nodes)
+
+        # socket.links scans every link in the tree on each access, so map
+        # each linked input socket to its source node in a single pass.
+        origin = {}
+        for link in node_tree.links:
+            origin.setdefault(link.to_socket, link.from_node)
+
+        # Single classification pass; a Principled BSDF takes precedence, so
+        # stop scanning as soon as one is found.
+        shader_nodes = {}
         for node in nodes:
-            if node.type == "BSDF_PRINCIPLED":
-                principled = node
+            node_type = node.type
+            shader_nodes[node_type] = node
+            if node_type == "BSDF_PRINCIPLED":
                 break
-            elif node.type == "BSDF_DIFFUSE":
-                diffuse_bsdf = node
-            elif node.type == "BSDF_GLOSSY":
-                glossy_bsdf = node
-            elif node.type == "MIX_SHADER":
-                mix_shader = node
-            elif node.type == "EMISSION":
-                emission_node = node
-            elif node.type == "BSDF_GLASS":
-                glass_bsdf = node
-            elif node.type == "BSDF_REFRACTION":
-                refract_bsdf = node
+
+        principled = shader_nodes.get("BSDF_PRINCIPLED")
+        diffuse_bsdf = shader_nodes.get("BSDF_DIFFUSE")
+        glossy_bsdf = shader_nodes.get("BSDF_GLOSSY")
+        mix_shader = shader_nodes.get("MIX_SHADER")
+        emission_node = shader_nodes.get("EMISSION")
+        glass_bsdf = shader_nodes.get("BSDF_GLASS")
+        refract_bsdf = shader_nodes.get("BSDF_REFRACTION")
 
         if principled:
-            base_color = principled.inputs["Base Color"].default_value
-            material.diffuse_color = Color(base_color[0], base_color[1], base_color[2])
+            inputs = principled.inputs
+            # Snapshot every socket value in one pass over the inputs rather
+            # than a lookup plus an RNA read per property below.
+            vals = {
+                socket.name: (
+                    socket.default_value[:]
+                    if socket.type in ("RGBA", "VECTOR")
+                    else socket.default_value
+                )
+                for socket in inputs
+                if socket.type != "SHADER"
+            }
+            base_color = vals["Base Color"]
+            material.diffuse_color = Color(*base_color[:3])
             material.ambient_color = Color(
                 base_color[0] * 0.1, base_color[1] * 0.1, base_color[2] * 0.1
             )
 
-            specular = (
-                principled.inputs["Specular IOR Level"].default_value
-                if "Specular IOR Level" in principled.inputs
-                else 0.5
-            )
+            specular = vals.get("Specular IOR Level", 0.5)
             material.specular_color = Color(specular, specular, specular)
 
-            roughness = principled.inputs["Roughness"].default_value
-            # Use a smoother, non-linear mapping for shininess to get softer highlights
-            # roughness 0.0 -> shininess ~80 (glossy but not super sharp)
-            # roughness 0.5 -> shininess ~20 (moderate)
-            # roughness 1.0 -> shininess ~1 (very rough)
-            material.shininess = max(1.0, pow(1.0 - roughness, 2.5) * 120.0)
+            roughness = vals["Roughness"]
+            material.shininess = roughness_to_shininess(roughness)
             material.glossiness = 1.0 - roughness  # Export glossiness
 
-            if "Metallic" in principled.inputs:
-                metallic = principled.inputs["Metallic"].default_value
+            if "Metallic" in vals:
+                metallic = vals["Metallic"]
                 material.reflectivity = metallic
 
             transmission_found = False
             for trans_name in ["Transmission Weight", "Transmission"]:
-                if trans_name in principled.inputs:
-                    transmission = principled.inputs[trans_name].default_value
+                if trans_name in vals:
+                    transmission = vals[trans_name]
                     material.transparency = transmission
                     transmission_found = True
                     break
 
-            if not transmission_found and "Alpha" in principled.inputs:
-                alpha = principled.inputs["Alpha"].default_value
+            if not transmission_found and "Alpha" in vals:
+                alpha = vals["Alpha"]
                 if alpha < 1.0:
                     material.transparency = 1.0 - alpha
                 else:
                     material.transparency = 0.0
 
-            if "IOR" in principled.inputs:
-                material.refractive_index = principled.inputs["IOR"].default_value
+            if "IOR" in vals:
+                material.refractive_index = vals["IOR"]
 
-            if (
-                "Emission Color" in principled.inputs
-                and "Emission Strength" in principled.inputs
-            ):
-                emission_color = principled.inputs["Emission Color"].default_value
-                emission_strength = principled.inputs["Emission Strength"].default_value
+            if "Emission Color" in vals and "Emission Strength" in vals:
+                emission_color = vals["Emission Color"]
+                emission_strength = vals["Emission Strength"]
                 if emission_strength > 0.0:
-                    material.emission_color = Color(
-                        emission_color[0], emission_color[1], emission_color[2]
-                    )
+                    material.emission_color = Color(*emission_color[:3])
                     material.emission_strength = emission_strength
 
-            if "Subsurface Weight" in principled.inputs:
-                subsurface = principled.inputs["Subsurface Weight"].default_value
+            if "Subsurface Weight" in vals:
+                subsurface = vals["Subsurface Weight"]
                 if subsurface > 0.0:
                     material.subsurface = subsurface
 
-            if "Sheen Weight" in principled.inputs:
-                sheen = principled.inputs["Sheen Weight"].default_value
+            if "Sheen Weight" in vals:
+                sheen = vals["Sheen Weight"]
                 if sheen > 0.0:
                     material.sheen = sheen
 
-            if "Coat Weight" in principled.inputs:
-                clearcoat = principled.inputs["Coat Weight"].default_value
+            if "Coat Weight" in vals:
+                clearcoat = vals["Coat Weight"]
                 if clearcoat > 0.0:
                     material.clearcoat = clearcoat
-                    if "Coat Roughness" in principled.inputs:
-                        material.clearcoat_roughness = principled.inputs[
-                            "Coat Roughness"
-                        ].default_value
+                    if "Coat Roughness" in vals:
+                        material.clearcoat_roughness = vals["Coat Roughness"]
 
             # Texture handling
-            tex_node = find_texture_node(principled.inputs["Base Color"])
+            tex_node = find_texture_node(inputs["Base Color"], origin)
             if tex_node and tex_node.image:
-                image_path = bpy.path.abspath(tex_node.image.filepath)
+                image_path = abspath(tex_node.image.filepath)
                 if image_path:
-                    material.texture_file = os.path.basename(image_path)
+                    material.texture_file = basename(image_path)
                     material.has_texture = True
 
         elif diffuse_bsdf and glossy_bsdf and mix_shader:
-            diffuse_color = diffuse_bsdf.inputs["Color"].default_value
+            diffuse_color = diffuse_bsdf.inputs["Color"].default_value[:3]
 
-            tex_node = find_texture_node(diffuse_bsdf.inputs["Color"])
+            tex_node = find_texture_node(diffuse_bsdf.inputs["Color"], origin)
             if tex_node and tex_node.image:
-                image_path = bpy.path.abspath(tex_node.image.filepath)
+                image_path = abspath(tex_node.image.filepath)
                 if image_path:
-                    material.texture_file = os.path.basename(image_path)
+                    material.texture_file = basename(image_path)
                     material.has_texture = True
                     material.diffuse_color = Color(1.0, 1.0, 1.0)
             else:
-                material.diffuse_color = Color(
-                    diffuse_color[0], diffuse_color[1], diffuse_color[2]
-                )
+                material.diffuse_color = Color(*diffuse_color)
 
             material.specular_color = Color(1.0, 1.0, 1.0)
             material.ambient_color = Color(
@@ -263,7 +330,7 @@ def export_material(obj) -> Material:
 
             if "Roughness" in glossy_bsdf.inputs:
                 roughness = glossy_bsdf.inputs["Roughness"].default_value
-                material.shininess = max(1.0, pow(1.0 - roughness, 2.5) * 120.0)
+                material.shininess = roughness_to_shininess(roughness)
                 material.glossiness = 1.0 - roughness
 
             if "Fac" in mix_shader.inputs:
@@ -273,14 +340,14 @@ def export_material(obj) -> Material:
                 material.reflectivity = 0.05
 
         elif glass_bsdf:
-            color = glass_bsdf.inputs["Color"].default_value
-            material.diffuse_color = Color(color[0], color[1], color[2])
+            color = glass_bsdf.inputs["Color"].default_value[:3]
+            material.diffuse_color = Color(*color)
             material.transparency = 1.0
             if "IOR" in glass_bsdf.inputs:
                 material.refractive_index = glass_bsdf.inputs["IOR"].default_value
             if "Roughness" in glass_bsdf.inputs:
                 roughness = glass_bsdf.inputs["Roughness"].default_value
-                material.shininess = max(1.0, pow(1.0 - roughness, 2.5) * 120.0)
+                material.shininess = roughness_to_shininess(roughness)
                 material.glossiness = 1.0 - roughness
             material.ambient_color = Color(
                 color[0] * 0.1, color[1] * 0.1, color[2] * 0.1
@@ -288,14 +355,14 @@ def export_material(obj) -> Material:
             material.specular_color = Color(1.0, 1.0, 1.0)
 
         elif refract_bsdf:
-            color = refract_bsdf.inputs["Color"].default_value
-            material.diffuse_color = Color(color[0], color[1], color[2])
+            color = refract_bsdf.inputs["Color"].default_value[:3]
+            material.diffuse_color = Color(*color)
             material.transparency = 1.0
             if "IOR" in refract_bsdf.inputs:
                 material.refractive_index = refract_bsdf.inputs["IOR"].default_value
             if "Roughness" in refract_bsdf.inputs:
                 roughness = refract_bsdf.inputs["Roughness"].default_value
-                material.shininess = max(1.0, pow(1.0 - roughness, 2.5) * 120.0)
+                material.shininess = roughness_to_shininess(roughness)
                 material.glossiness = 1.0 - roughness
             material.ambient_color = Color(
                 color[0] * 0.1, color[1] * 0.1, color[2] * 0.1
@@ -303,75 +370,106 @@ def export_material(obj) -> Material:
             material.specular_color = Color(1.0, 1.0, 1.0)
 
         if emission_node:
-            emission_color = emission_node.inputs["Color"].default_value
+            emission_color = emission_node.inputs["Color"].default_value[:3]
             emission_strength = emission_node.inputs["Strength"].default_value
-            material.emission_color = Color(
-                emission_color[0], emission_color[1], emission_color[2]
-            )
+            material.emission_color = Color(*emission_color)
             material.emission_strength = emission_strength
 
         for node in nodes:
-            if node.type == "NORMAL_MAP" and node.inputs["Color"].is_linked:
-                link = node.inputs["Color"].links[0]
-                if link.from_node.type == "TEX_IMAGE" and link.from_node.image:
-                    normal_path = bpy.path.abspath(link.from_node.image.filepath)
-                    material.normal_map = os.path.basename(normal_path)
+            if node.type == "NORMAL_MAP":
+                source = origin.get(node.inputs["Color"])
+                if source is None:
+                    continue
+                if source.type == "TEX_IMAGE" and source.image:
+                    normal_path = abspath(source.image.filepath)
+                    material.normal_map = basename(normal_path)
                 break
         for node in nodes:
-            if node.type == "BUMP" and node.inputs["Height"].is_linked:
-                link = node.inputs["Height"].links[0]
-                if link.from_node.type == "TEX_IMAGE" and link.from_node.image:
-                    bump_path = bpy.path.abspath(link.from_node.image.filepath)
-                    material.bump_map = os.path.basename(bump_path)
+            if node.type == "BUMP":
+                source = origin.get(node.inputs["Height"])
+                if source is None:
+                    continue
+                if source.type == "TEX_IMAGE" and source.image:
+                    bump_path = abspath(source.image.filepath)
+                    material.bump_map = basename(bump_path)
                     if "Strength" in node.inputs:
                         material.bump_strength = node.inputs["Strength"].default_value
                 break
 
     else:
-        material.diffuse_color = Color(
-            mat.diffuse_color[0], mat.diffuse_color[1], mat.diffuse_color[2]
-        )
-        material.specular_color = Color(
-            mat.specular_color[0], mat.specular_color[1], mat.specular_color[2]
-        )
+        material.diffuse_color = Color(*mat.diffuse_color[:3])
+        material.specular_color = Color(*mat.specular_color[:3])
         material.shininess = mat.specular_intensity * 128.0
         material.glossiness = 0.0
 
     return material
 
 
-def get_motion_data(obj):
-    """Check for animation and return transform matrices at t=0 and t=1."""
-    if not obj.animation_data or not obj.animation_data.action:
-        return False, None, None
+# World matrices at t=0 and t=1 for animated objects, keyed by object name.
+_motion_matrices = {}
+
+
+def cache_motion_data(objects):
+    """Sample world matrices of all animated objects at t=0 and t=1.
+
+    Changing frame re-evaluates the whole scene, so every animated object is
+    sampled in one pass instead of stepping the frame once per object.
+    """
+    _motion_matrices.clear()
+    animated = [
+        obj
+        for obj in objects
+        if obj.type == "MESH"
+        and not obj.hide_render
+        and obj.animation_data
+        and obj.animation_data.action
+    ]
+    if not animated:
+        return
 
     scene = bpy.context.scene
     current_frame = scene.frame_current
 
-    matrix_t0 = obj.matrix_world.copy()
+    matrices_t0 = [obj.matrix_world.copy() for obj in animated]
 
     try:
         scene.frame_set(current_frame + 1)
-        matrix_t1 = obj.matrix_world.copy()
-        return True, matrix_t0, matrix_t1
+        for obj, matrix_t0 in zip(animated, matrices_t0):
+            _motion_matrices[obj.name] = (matrix_t0, obj.matrix_world.copy())
     finally:
         scene.frame_set(current_frame)
 
 
-def export_camera(cam_obj) -> Camera:
+def get_motion_data(obj):
+    """Check for animation and return transform matrices at t=0 and t=1."""
+    matrices = _motion_matrices.get(obj.name)
+    if matrices is None:
+        return False, None, None
+    return True, matrices[0], matrices[1]
+
+
+# Local-space forward (-Z) and up (+Y) axes for cameras and lights. Shared
+# because `matrix @ vector` never modifies its operand.
+_VEC_NEG_Z = mathutils.Vector((0.0, 0.0, -1.0))
+_VEC_POS_Y = mathutils.Vector((0.0, 1.0, 0.0))
+
+
+def export_camera(
+    cam_obj,
+    # Bound as defaults so the body resolves them as locals, not globals.
+    direction_from_vector=Direction.from_vector,
+    point_from_vector=Point.from_vector,
+) -> Camera:
     cam = cam_obj.data
     scene = bpy.context.scene
     matrix = cam_obj.matrix_world
-    gaze = Direction.from_vector(
-        matrix @ mathutils.Vector((0, 0, -1)) - matrix.translation
-    )
-    up = Direction.from_vector(
-        matrix @ mathutils.Vector((0, 1, 0)) - matrix.translation
-    )
+    translation = matrix.translation
+    gaze = direction_from_vector(matrix @ _VEC_NEG_Z - translation)
+    up = direction_from_vector(matrix @ _VEC_POS_Y - translation)
 
     camera = Camera(
         name=cam_obj.name,
-        location=Point.from_vector(cam_obj.location),
+        location=point_from_vector(cam_obj.location),
         gaze_direction=gaze,
         up_direction=up,
         focal_length=cam.lens,
@@ -407,7 +505,7 @@ def export_light(light_obj) -> Light:
         name=light_obj.name,
         location=Point.from_vector(light_obj.location),
         intensity=light.energy,
-        color=Color(light.color.r, light.color.g, light.color.b),
+        color=Color(*light.color[:3]),
     )
     light_data.light_type = light.type
 
@@ -423,7 +521,7 @@ def export_light(light_obj) -> Light:
         )
 
         matrix = light_obj.matrix_world
-        direction = matrix @ mathutils.Vector((0, 0, -1)) - matrix.translation
+        direction = matrix @ _VEC_NEG_Z - matrix.translation
         light_data.normal = Direction.from_vector(direction)
 
         if "samples" in light_obj:
@@ -433,7 +531,7 @@ def export_light(light_obj) -> Light:
 
     if light.type == "SUN":
         matrix = light_obj.matrix_world
-        direction = matrix @ mathutils.Vector((0, 0, -1)) - matrix.translation
+        direction = matrix @ _VEC_NEG_Z - matrix.translation
         light_data.direction = Direction.from_vector(direction)
         light_data.angle = light.angle if hasattr(light, "angle") else 0.0
 
@@ -445,14 +543,20 @@ def export_light(light_obj) -> Light:
     return light_data
 
 
-def export_shape(obj, ShapeClass):
-    """Generic export for shapes with motion data."""
+def export_shape(obj, ShapeClass, Point=Point):
+    """Generic export for shapes with motion data.
+
+    `Point` is bound as a default so the body resolves it as a local.
+    """
     mat = export_material(obj)
 
-    base_scale = obj.matrix_world.to_scale()
+    # Each matrix_world access goes through RNA and builds a new Matrix.
+    matrix = obj.matrix_world
     dims = obj.dimensions
 
     if ShapeClass in [Sphere, Cube]:
+        base_scale = matrix.to_scale()
+        rotation = Point.from_vector(matrix.to_euler())
         sx = (dims.x / 2.0) * (-1.0 if base_scale.x < 0 else 1.0)
         sy = (dims.y / 2.0) * (-1.0 if base_scale.y < 0 else 1.0)
         sz = (dims.z / 2.0) * (-1.0 if base_scale.z < 0 else 1.0)
@@ -462,16 +566,16 @@ def export_shape(obj, ShapeClass):
         if ShapeClass == Sphere:
             shape = Sphere(
                 name=obj.name,
-                location=Point.from_vector(obj.matrix_world.translation),
-                rotation=Point.from_vector(obj.matrix_world.to_euler()),
+                location=Point.from_vector(matrix.translation),
+                rotation=rotation,
                 scale=Point(sx, sy, sz),
                 material=mat,
             )
         elif ShapeClass == Cube:
             shape = Cube(
                 name=obj.name,
-                translation=Point.from_vector(obj.matrix_world.translation),
-                rotation=Point.from_vector(obj.matrix_world.to_euler()),
+                translation=Point.from_vector(matrix.translation),
+                rotation=rotation,
                 scale=Point(sx, sy, sz),
                 material=mat,
             )
@@ -482,8 +586,14 @@ def export_shape(obj, ShapeClass):
             shape.matrix_t1 = matrix_t1
 
     elif ShapeClass == Plane:
-        mesh = obj.data
-        points = [Point.from_vector(obj.matrix_world @ v.co) for v in mesh.vertices]
+        # Bulk-copy vertex coordinates and transform them in one matmul
+        # instead of one Python-level `matrix @ v.co` per vertex.
+        vertices = obj.data.vertices
+        count = len(vertices)
+        coords = np.empty(count * 3, dtype=np.float32)
+        vertices.foreach_get("co", coords)
+        transform = np.array(matrix, dtype=np.float32)
+        points = transform_points(transform, coords.reshape(count, 3))
         has_motion, matrix_t0, matrix_t1 = get_motion_data(obj)
         shape = Plane(name=obj.name, points=points, material=mat)
         if has_motion:
@@ -492,11 +602,12 @@ def export_shape(obj, ShapeClass):
             shape.matrix_t1 = matrix_t1
 
     elif ShapeClass == Torus:
-        location, _, scale = obj.matrix_world.decompose()
+        location, _, scale = matrix.decompose()
+        rotation = Point.from_vector(matrix.to_euler())
         s_x = scale.x if scale.x != 0 else 1.0
         s_z = scale.z if scale.z != 0 else 1.0
-        raw_height = obj.dimensions.z / s_z
-        raw_width = obj.dimensions.x / s_x
+        raw_height = dims.z / s_z
+        raw_width = dims.x / s_x
         calc_minor = raw_height / 2.0
         calc_major = (raw_width / 2.0) - calc_minor
         if calc_major <= 0:
@@ -506,7 +617,7 @@ def export_shape(obj, ShapeClass):
         shape = Torus(
             name=obj.name,
             location=Point.from_vector(location),
-            rotation=Point.from_vector(obj.matrix_world.to_euler()),
+            rotation=rotation,
             scale=Point.from_vector(scale),
             major_radius=calc_major,
             minor_radius=calc_minor,
@@ -518,17 +629,18 @@ def export_shape(obj, ShapeClass):
             shape.matrix_t1 = matrix_t1
 
     elif ShapeClass in [Cylinder, Cone]:
-        location, _, scale = obj.matrix_world.decompose()
+        location, _, scale = matrix.decompose()
+        rotation = Point.from_vector(matrix.to_euler())
         s_x = scale.x if scale.x != 0 else 1.0
         s_z = scale.z if scale.z != 0 else 1.0
-        calc_radius = (obj.dimensions.x / 2.0) / s_x
-        calc_depth = obj.dimensions.z / s_z
+        calc_radius = (dims.x / 2.0) / s_x
+        calc_depth = dims.z / s_z
 
         has_motion, matrix_t0, matrix_t1 = get_motion_data(obj)
         shape = ShapeClass(
             name=obj.name,
             location=Point.from_vector(location),
-            rotation=Point.from_vector(obj.matrix_world.to_euler()),
+            rotation=rotation,
             scale=Point.from_vector(scale),
             radius=calc_radius,
             depth=calc_depth,
@@ -539,212 +651,272 @@ def export_shape(obj, ShapeClass):
             shape.matrix_t0 = matrix_t0
             shape.matrix_t1 = matrix_t1
 
-    shape.visible = not obj.hide_render
     return shape
 
 
-def write_material(f, material: Material):
-    f.write(
-        f"material_diffuse {material.diffuse_color.x} {material.diffuse_color.y} {material.diffuse_color.z}\n"
-    )
-    f.write(
-        f"material_specular {material.specular_color.x} {material.specular_color.y} {material.specular_color.z}\n"
-    )
-    f.write(
-        f"material_ambient {material.ambient_color.x} {material.ambient_color.y} {material.ambient_color.z}\n"
-    )
-    f.write(f"material_shininess {material.shininess}\n")
-    f.write(f"material_glossiness {material.glossiness}\n")
-    f.write(f"material_reflectivity {material.reflectivity}\n")
-    f.write(f"material_transparency {material.transparency}\n")
-    f.write(f"material_refractive_index {material.refractive_index}\n")
-
-    if hasattr(material, "emission_strength") and material.emission_strength > 0.0:
-        f.write(
-            f"material_emission {material.emission_color.x} {material.emission_color.y} {material.emission_color.z}\n"
-        )
-        f.write(f"material_emission_strength {material.emission_strength}\n")
+def format_rows(rows) -> str:
+    """Format a 2D array (matrix, vertex list) as space-separated text rows.
+
+    The rows are formatted by NumPy in C rather than per float in Python; 9
+    significant digits round-trip Blender's single-precision values exactly.
+    """
+    buf = io.StringIO()
+    np.savetxt(buf, np.asarray(rows, dtype=np.float64), fmt="%.9g")
+    return buf.getvalue()
+
+
+# "%s" formats floats with repr(), so triplets keep full precision while
+# skipping the per-field f-string formatting.
+_F3 = "%s %s %s %s\n".__mod__
+
 
-    if hasattr(material, "subsurface") and material.subsurface > 0.0:
-        f.write(f"material_subsurface {material.subsurface}\n")
-    if hasattr(material, "sheen") and material.sheen > 0.0:
-        f.write(f"material_sheen {material.sheen}\n")
-    if hasattr(material, "clearcoat") and material.clearcoat > 0.0:
-        f.write(f"material_clearcoat {material.clearcoat}\n")
-        if hasattr(material, "clearcoat_roughness"):
-            f.write(f"material_clearcoat_roughness {material.clearcoat_roughness}\n")
+def _v3(label, v):
+    """Format one `label x y z` line from anything with x/y/z attributes."""
+    return _F3((label, v.x, v.y, v.z))
+
+
+def write_material(out, material: Material):
+    """Append the material lines for one shape to the `out` buffer."""
+    out.append(_v3("material_diffuse", material.diffuse_color))
+    out.append(_v3("material_specular", material.specular_color))
+    out.append(_v3("material_ambient", material.ambient_color))
+    out.append(f"material_shininess {material.shininess}\n")
+    out.append(f"material_glossiness {material.glossiness}\n")
+    out.append(f"material_reflectivity {material.reflectivity}\n")
+    out.append(f"material_transparency {material.transparency}\n")
+    out.append(f"material_refractive_index {material.refractive_index}\n")
+
+    if material.emission_strength > 0.0:
+        out.append(_v3("material_emission", material.emission_color))
+        out.append(f"material_emission_strength {material.emission_strength}\n")
+
+    if material.subsurface > 0.0:
+        out.append(f"material_subsurface {material.subsurface}\n")
+    if material.sheen > 0.0:
+        out.append(f"material_sheen {material.sheen}\n")
+    if material.clearcoat > 0.0:
+        out.append(f"material_clearcoat {material.clearcoat}\n")
+        out.append(f"material_clearcoat_roughness {material.clearcoat_roughness}\n")
 
     if material.has_texture:
-        f.write(f"material_texture {material.texture_file}\n")
-    if hasattr(material, "normal_map") and material.normal_map:
-        f.write(f"material_normal_map {material.normal_map}\n")
-    if hasattr(material, "bump_map") and material.bump_map:
-        f.write(f"material_bump_map {material.bump_map}\n")
-        if hasattr(material, "bump_strength"):
-            f.write(f"material_bump_strength {material.bump_strength}\n")
-
-
-def export_to_text(scene_data, filepath):
-    with open(filepath, "w") as f:
-        scene = bpy.context.scene
-        f.write("SCENE_SETTINGS\n")
-        if scene.world and scene.world.use_nodes:
-            for node in scene.world.node_tree.nodes:
-                if node.type == "BACKGROUND":
-                    bg_color = node.inputs["Color"].default_value
-                    bg_strength = node.inputs["Strength"].default_value
-                    f.write(
-                        f"background_color {bg_color[0]} {bg_color[1]} {bg_color[2]}\n"
-                    )
-                    f.write(f"background_strength {bg_strength}\n")
-                    break
-        else:
-            f.write("background_color 0.05 0.05 0.05\n")
-            f.write("background_strength 1.0\n")
-
-        if scene.world:
-            f.write("ambient_light 0.1 0.1 0.1\n")
-        f.write(f"frame_current {scene.frame_current}\n")
-        f.write(f"frame_start {scene.frame_start}\n")
-        f.write(f"frame_end {scene.frame_end}\n")
-        f.write(f"fps {scene.render.fps}\n")
-        f.write("max_bounces 12\n")
-        f.write("diffuse_bounces 4\n")
-        f.write("glossy_bounces 4\n")
-        f.write("transmission_bounces 12\n")
-        f.write("\n")
-
-        f.write(f"CAMERAS {len(scene_data['cameras'])}\n")
-        for cam in scene_data["cameras"]:
-            f.write(f"name {cam.name}\n")
-            f.write(f"location {cam.location.x} {cam.location.y} {cam.location.z}\n")
-            f.write(
-                f"gaze {cam.gaze_direction.x} {cam.gaze_direction.y} {cam.gaze_direction.z}\n"
-            )
-            f.write(
-                f"up {cam.up_direction.x} {cam.up_direction.y} {cam.up_direction.z}\n"
-            )
-            f.write(f"focal {cam.focal_length}\n")
-            f.write(f"sensor {cam.sensor_width} {cam.sensor_height}\n")
-            f.write(f"resolution {cam.film_resolution_x} {cam.film_resolution_y}\n")
-            if hasattr(cam, "dof_enabled"):
-                f.write(f"dof_enabled {1 if cam.dof_enabled else 0}\n")
-                f.write(f"focus_distance {cam.focus_distance}\n")
-                f.write(f"aperture_fstop {cam.aperture_fstop}\n")
-                f.write(f"aperture_blades {cam.aperture_blades}\n")
-            if hasattr(cam, "camera_type"):
-                f.write(f"camera_type {cam.camera_type}\n")
-            if hasattr(cam, "clip_start"):
-                f.write(f"clip_start {cam.clip_start}\n")
-                f.write(f"clip_end {cam.clip_end}\n")
-
-        f.write(f"LIGHTS {len(scene_data['lights'])}\n")
-        for light in scene_data["lights"]:
-            f.write(f"name {light.name}\n")
-            f.write(
-                f"location {light.location.x} {light.location.y} {light.location.z}\n"
-            )
-            f.write(f"intensity {light.intensity}\n")
-            f.write(f"color {light.color.x} {light.color.y} {light.color.z}\n")
-            f.write(f"light_type {light.light_type}\n")
-
-            if light.light_type == "SPOT":
-                f.write(f"spot_size {light.spot_size}\n")
-                f.write(f"spot_blend {light.spot_blend}\n")
-            if light.light_type == "AREA":
-                f.write(f"area_shape {light.area_shape}\n")
-                f.write(f"area_size {light.area_size_x} {light.area_size_y}\n")
-                # Export area light normal and samples
-                if hasattr(light, "normal") and light.normal:
-                    f.write(
-                        f"normal {light.normal.x} {light.normal.y} {light.normal.z}\n"
-                    )
-                if hasattr(light, "samples"):
-                    f.write(f"samples {light.samples}\n")
-            if light.light_type == "SUN":
-                f.write(
-                    f"direction {light.direction.x} {light.direction.y} {light.direction.z}\n"
-                )
-                f.write(f"angle {light.angle}\n")
+        out.append(f"material_texture {material.texture_file}\n")
+    if material.normal_map:
+        out.append(f"material_normal_map {material.normal_map}\n")
+    if material.bump_map:
+        out.append(f"material_bump_map {material.bump_map}\n")
+        out.append(f"material_bump_strength {material.bump_strength}\n")
+
+
+def write_shape_tail(out, shape):
+    """Append the motion, visibility and material lines shared by all shapes."""
+    if shape.motion_blur and shape.matrix_t0 is not None:
+        out.append("motion_blur 1\n")
+        out.append("matrix_t0\n")
+        out.append(format_rows(shape.matrix_t0))
+        out.append("matrix_t1\n")
+        out.append(format_rows(shape.matrix_t1))
+
+    # Render-hidden meshes are never exported, so this is always 1; the line
+    # stays because SceneLoader expects it.
+    out.append(f"visible {1 if shape.visible else 0}\n")
+    write_material(out, shape.material)
+
+
+def write_sphere(out, sphere: Sphere):
+    loc, rot, scale = sphere.location, sphere.rotation, sphere.scale
+    out.append(f"name {sphere.name}\n")
+    out.append(_v3("location", loc))
+    out.append(_v3("rotation", rot))
+    out.append(_v3("scale", scale))
+    write_shape_tail(out, sphere)
+
+
+def write_cube(out, cube: Cube):
+    trans, rot, scale = cube.translation, cube.rotation, cube.scale
+    out.append(f"name {cube.name}\n")
+    out.append(_v3("translation", trans))
+    out.append(_v3("rotation", rot))
+    out.append(_v3("scale", scale))
+    write_shape_tail(out, cube)
+
+
+def write_plane(out, plane: Plane):
+    out.append(f"name {plane.name}\n")
+    out.append(f"points {len(plane.points)}\n")
+    out.append(format_rows(plane.points))
+    write_shape_tail(out, plane)
+
+
+def write_torus(out, torus: Torus):
+    loc, rot, scale = torus.location, torus.rotation, torus.scale
+    out.append(f"name {torus.name}\n")
+    out.append(_v3("location", loc))
+    out.append(_v3("rotation", rot))
+    out.append(_v3("scale", scale))
+    out.append(f"major_radius {torus.major_radius}\n")
+    out.append(f"minor_radius {torus.minor_radius}\n")
+    write_shape_tail(out, torus)
+
+
+def write_cylinder(out, shape):
+    """Write a Cylinder or Cone; both share the same schema."""
+    loc, rot, scale = shape.location, shape.rotation, shape.scale
+    out.append(f"name {shape.name}\n")
+    out.append(_v3("location", loc))
+    out.append(_v3("rotation", rot))
+    out.append(_v3("scale", scale))
+    out.append(f"radius {shape.radius}\n")
+    out.append(f"depth {shape.depth}\n")
+    write_shape_tail(out, shape)
+
+
+# Section header, scene_data key and writer for each shape type, in file order.
+# Each shape class has a fixed schema, so its writer is straight-line code.
+_SHAPE_SECTIONS = (
+    ("SPHERES", "spheres", write_sphere),
+    ("CUBES", "cubes", write_cube),
+    ("PLANES", "planes", write_plane),
+    ("TORUSES", "toruses", write_torus),
+    ("CYLINDERS", "cylinders", write_cylinder),
+    ("CONES", "cones", write_cylinder),
+)
 
-            f.write(f"cast_shadows {1 if light.cast_shadows else 0}\n")
-            f.write(f"shadow_soft_size {light.shadow_soft_size}\n")
 
-        def write_shape_data(shape, has_pos=False, has_trans=False):
-            f.write(f"name {shape.name}\n")
-            if has_pos:
-                f.write(
-                    f"location {shape.location.x} {shape.location.y} {shape.location.z}\n"
-                )
-            if has_trans:
-                f.write(
-                    f"translation {shape.translation.x} {shape.translation.y} {shape.translation.z}\n"
-                )
-            if hasattr(shape, "rotation"):
-                f.write(
-                    f"rotation {shape.rotation.x} {shape.rotation.y} {shape.rotation.z}\n"
+def export_to_text(scene_data, filepath, compress=False):
+    # Lines are collected in memory and written in one call at the end.
+    out = []
+    scene = bpy.context.scene
+    out.append("SCENE_SETTINGS\n")
+    if scene.world and scene.world.use_nodes:
+        for node in scene.world.node_tree.nodes:
+            if node.type == "BACKGROUND":
+                bg_color = node.inputs["Color"].default_value[:3]
+                bg_strength = node.inputs["Strength"].default_value
+                out.append(
+                    f"background_color {bg_color[0]} {bg_color[1]} {bg_color[2]}\n"
                 )
-            if hasattr(shape, "scale"):
-                f.write(f"scale {shape.scale.x} {shape.scale.y} {shape.scale.z}\n")
-            if hasattr(shape, "radius"):
-                f.write(f"radius {shape.radius}\n")
-            if hasattr(shape, "depth"):
-                f.write(f"depth {shape.depth}\n")
-            if hasattr(shape, "major_radius"):
-                f.write(f"major_radius {shape.major_radius}\n")
-            if hasattr(shape, "minor_radius"):
-                f.write(f"minor_radius {shape.minor_radius}\n")
-            if hasattr(shape, "points"):
-                f.write(f"points {len(shape.points)}\n")
-                for pt in shape.points:
-                    f.write(f"{pt.x} {pt.y} {pt.z}\n")
-
-            if (
-                shape.motion_blur
-                and hasattr(shape, "matrix_t0")
-                and hasattr(shape, "matrix_t1")
-            ):
-                f.write("motion_blur 1\n")
-                f.write("matrix_t0\n")
-                for row in range(4):
-                    f.write(
-                        f"{shape.matrix_t0[row][0]} {shape.matrix_t0[row][1]} {shape.matrix_t0[row][2]} {shape.matrix_t0[row][3]}\n"
-                    )
-                f.write("matrix_t1\n")
-                for row in range(4):
-                    f.write(
-                        f"{shape.matrix_t1[row][0]} {shape.matrix_t1[row][1]} {shape.matrix_t1[row][2]} {shape.matrix_t1[row][3]}\n"
-                    )
-
-            f.write(f"visible {1 if shape.visible else 0}\n")
-            write_material(f, shape.material)
-
-        f.write(f"SPHERES {len(scene_data['spheres'])}\n")
-        for s in scene_data["spheres"]:
-            write_shape_data(s, has_pos=True)
-
-        f.write(f"CUBES {len(scene_data['cubes'])}\n")
-        for c in scene_data["cubes"]:
-            write_shape_data(c, has_trans=True)
-
-        f.write(f"PLANES {len(scene_data['planes'])}\n")
-        for p in scene_data["planes"]:
-            write_shape_data(p)
-
-        f.write(f"TORUSES {len(scene_data['toruses'])}\n")
-        for t in scene_data["toruses"]:
-            write_shape_data(t, has_pos=True)
-
-        f.write(f"CYLINDERS {len(scene_data['cylinders'])}\n")
-        for c in scene_data["cylinders"]:
-            write_shape_data(c, has_pos=True)
-
-        f.write(f"CONES {len(scene_data['cones'])}\n")
-        for c in scene_data["cones"]:
-            write_shape_data(c, has_pos=True)
+                out.append(f"background_strength {bg_strength}\n")
+                break
+    else:
+        out.append("background_color 0.05 0.05 0.05\n")
+        out.append("background_strength 1.0\n")
+
+    if scene.world:
+        out.append("ambient_light 0.1 0.1 0.1\n")
+    out.append(f"frame_current {scene.frame_current}\n")
+    out.append(f"frame_start {scene.frame_start}\n")
+    out.append(f"frame_end {scene.frame_end}\n")
+    out.append(f"fps {scene.render.fps}\n")
+    out.append("max_bounces 12\n")
+    out.append("diffuse_bounces 4\n")
+    out.append("glossy_bounces 4\n")
+    out.append("transmission_bounces 12\n")
+    out.append("\n")
+
+    out.append(f"CAMERAS {len(scene_data['cameras'])}\n")
+    for cam in scene_data["cameras"]:
+        out.append(f"name {cam.name}\n")
+        out.append(_v3("location", cam.location))
+        out.append(_v3("gaze", cam.gaze_direction))
+        out.append(_v3("up", cam.up_direction))
+        out.append(f"focal {cam.focal_length}\n")
+        out.append(f"sensor {cam.sensor_width} {cam.sensor_height}\n")
+        out.append(f"resolution {cam.film_resolution_x} {cam.film_resolution_y}\n")
+        out.append(f"dof_enabled {1 if cam.dof_enabled else 0}\n")
+        out.append(f"focus_distance {cam.focus_distance}\n")
+        out.append(f"aperture_fstop {cam.aperture_fstop}\n")
+        out.append(f"aperture_blades {cam.aperture_blades}\n")
+        out.append(f"camera_type {cam.camera_type}\n")
+        out.append(f"clip_start {cam.clip_start}\n")
+        out.append(f"clip_end {cam.clip_end}\n")
+
+    out.append(f"LIGHTS {len(scene_data['lights'])}\n")
+    for light in scene_data["lights"]:
+        out.append(f"name {light.name}\n")
+        out.append(_v3("location", light.location))
+        out.append(f"intensity {light.intensity}\n")
+        out.append(_v3("color", light.color))
+        out.append(f"light_type {light.light_type}\n")
+
+        if light.light_type == "SPOT":
+            out.append(f"spot_size {light.spot_size}\n")
+            out.append(f"spot_blend {light.spot_blend}\n")
+        if light.light_type == "AREA":
+            out.append(f"area_shape {light.area_shape}\n")
+            out.append(f"area_size {light.area_size_x} {light.area_size_y}\n")
+            # Export area light normal and samples
+            if light.normal:
+                out.append(_v3("normal", light.normal))
+            out.append(f"samples {light.samples}\n")
+        if light.light_type == "SUN":
+            out.append(_v3("direction", light.direction))
+            out.append(f"angle {light.angle}\n")
+
+        out.append(f"cast_shadows {1 if light.cast_shadows else 0}\n")
+        out.append(f"shadow_soft_size {light.shadow_soft_size}\n")
+
+    for header, key, write_shape in _SHAPE_SECTIONS:
+        shapes = scene_data[key]
+        out.append(f"{header} {len(shapes)}\n")
+        for shape in shapes:
+            write_shape(out, shape)
+
+    if compress:
+        # The C++ SceneLoader reads plain text only; keep this opt-in.
+        with gzip.open(filepath + ".gz", "wt", compresslevel=1, encoding="utf-8") as f:
+            f.write("".join(out))
+    else:
+        with open(filepath, "w", buffering=1 << 20) as f:
+            f.write("".join(out))
+
+
+def _add_camera(obj, scene_data):
+    scene_data["cameras"].append(export_camera(obj))
+
+
+def _add_light(obj, scene_data):
+    scene_data["lights"].append(export_light(obj))
+
+
+# Shape type detected from an object or mesh name -> (scene_data key, exporter
+# with the shape class pre-bound). The type list and the detection regex are
+# derived from this table.
+_BUCKETS = {
+    "sphere": ("spheres", partial(export_shape, ShapeClass=Sphere)),
+    "cube": ("cubes", partial(export_shape, ShapeClass=Cube)),
+    "plane": ("planes", partial(export_shape, ShapeClass=Plane)),
+    "torus": ("toruses", partial(export_shape, ShapeClass=Torus)),
+    "cylinder": ("cylinders", partial(export_shape, ShapeClass=Cylinder)),
+    "cone": ("cones", partial(export_shape, ShapeClass=Cone)),
+}
+_TYPES = tuple(_BUCKETS)
+_TYPE_RE = re.compile("|".join(_TYPES))
+
+
+def _bucket_mesh(obj, scene_data):
+    """Queue a mesh object in its shape bucket; export_scene exports it later."""
+    # Render-hidden meshes are skipped before any material or mesh work; the
+    # raytracer would discard them anyway.
+    if obj.hide_render:
+        return
+
+    # One lowercase pass and one search; the object name comes first so it
+    # wins over the mesh name, and "|" keeps matches from spanning both.
+    match = _TYPE_RE.search(f"{obj.name}|{obj.data.name}".lower())
+    if match:
+        scene_data[_BUCKETS[match.group()][0]].append(obj)
+
+
+# Blender object type -> handler adding the exported object to scene_data.
+_OBJECT_EXPORTERS = {
+    "CAMERA": _add_camera,
+    "LIGHT": _add_light,
+    "MESH": _bucket_mesh,
+}
 
 
 def export_scene():
+    _material_cache.clear()
     scene_data = {
         "cameras": [],
         "lights": [],
@@ -755,37 +927,17 @@ def export_scene():
         "cylinders": [],
         "cones": [],
     }
+    cache_motion_data(bpy.data.objects)
+
     for obj in bpy.data.objects:
-        if obj.type == "CAMERA":
-            scene_data["cameras"].append(export_camera(obj))
-        elif obj.type == "LIGHT":
-            scene_data["lights"].append(export_light(obj))
-        elif obj.type == "MESH":
-            obj_name = obj.name.lower()
-            mesh_name = obj.data.name.lower()
-            obj_type = None
-            for t in ["sphere", "cube", "plane", "torus", "cylinder", "cone"]:
-                if t in obj_name:
-                    obj_type = t
-                    break
-            if not obj_type:
-                for t in ["sphere", "cube", "plane", "torus", "cylinder", "cone"]:
-                    if t in mesh_name:
-                        obj_type = t
-                        break
-
-            if obj_type == "sphere":
-                scene_data["spheres"].append(export_shape(obj, Sphere))
-            elif obj_type == "cube":
-                scene_data["cubes"].append(export_shape(obj, Cube))
-            elif obj_type == "plane":
-                scene_data["planes"].append(export_shape(obj, Plane))
-            elif obj_type == "torus":
-                scene_data["toruses"].append(export_shape(obj, Torus))
-            elif obj_type == "cylinder":
-                scene_data["cylinders"].append(export_shape(obj, Cylinder))
-            elif obj_type == "cone":
-                scene_data["cones"].append(export_shape(obj, Cone))
+        exporter = _OBJECT_EXPORTERS.get(obj.type)
+        if exporter:
+            exporter(obj, scene_data)
+
+    # Meshes are exported one type at a time, so export_shape runs the same
+    # class branch back to back instead of interleaving types.
+    for key, export in _BUCKETS.values():
+        scene_data[key] = [export(obj) for obj in scene_data[key]]
 
     return scene_data
 
@@ -794,33 +946,75 @@ def main():
     log_path = os.path.join(os.path.dirname(__file__), "export_log.txt")
     import sys
 
-    log_file = open(log_path, "w")
+    log_file = open(log_path, "w", buffering=1 << 20)
     original_stdout = sys.stdout
 
+    # Log-file writes run on a background thread so they overlap the export;
+    # None tells the thread to stop.
+    log_queue = queue.Queue(maxsize=1024)
+    log_errors = []
+
+    def drain_log():
+        # Keep consuming after a failed write so producers never block on a
+        # full queue; the first error is re-raised once the export is done.
+        for chunk in iter(log_queue.get, None):
+            if log_errors:
+                continue
+            try:
+                log_file.write(chunk)
+            except Exception as exc:
+                log_errors.append(exc)
+
+    log_thread = threading.Thread(target=drain_log, daemon=True)
+    log_thread.start()
+
     class DualWriter:
-        def __init__(self, f1, f2):
-            self.f1, self.f2 = f1, f2
+        # print() issues separate writes for the text and the newline, so
+        # pieces are joined and forwarded once per line (or per 64 KiB).
+        def __init__(self, stream, log_queue):
+            self.stream, self.log_queue = stream, log_queue
+            self._buf = []
+            self._size = 0
 
         def write(self, t):
-            self.f1.write(t)
-            self.f2.write(t)
+            self._buf.append(t)
+            self._size += len(t)
+            if self._size >= 1 << 16 or "\n" in t:
+                self._drain()
+
+        def _drain(self):
+            if self._buf:
+                chunk = "".join(self._buf)
+                self._buf.clear()
+                self._size = 0
+                self.stream.write(chunk)
+                # Blocks only when the log thread is 1024 chunks behind.
+                self.log_queue.put(chunk)
 
         def flush(self):
-            self.f1.flush()
-            self.f2.flush()
-
-    sys.stdout = DualWriter(original_stdout, log_file)
-
-    scene_data = export_scene()
-    blend_filepath = bpy.data.filepath
-    scene_name = os.path.splitext(os.path.basename(blend_filepath))[0]
-    output_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "ASCII")
-    os.makedirs(output_dir, exist_ok=True)
-    output_path = os.path.join(output_dir, f"{scene_name}.txt")
-    export_to_text(scene_data, output_path)
+            self._drain()
+            self.stream.flush()
 
-    sys.stdout = original_stdout
-    log_file.close()
+    sys.stdout = DualWriter(original_stdout, log_queue)
+    # Flush and drain the log even if the export fails, so the lines leading
+    # up to the error are kept.
+    try:
+        scene_data = export_scene()
+        blend_filepath = bpy.data.filepath
+        scene_name = os.path.splitext(os.path.basename(blend_filepath))[0]
+        output_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "ASCII")
+        os.makedirs(output_dir, exist_ok=True)
+        output_path = os.path.join(output_dir, f"{scene_name}.txt")
+        export_to_text(scene_data, output_path, compress=COMPRESS_OUTPUT)
+    finally:
+        sys.stdout.flush()
+        sys.stdout = original_stdout
+        log_queue.put(None)
+        log_thread.join()
+        log_file.close()
+
+    if log_errors:
+        raise log_errors[0]
 
 
 if __name__ == "__main__":
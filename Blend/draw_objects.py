@@ -3,22 +3,111 @@ import sys
 
 sys.path.insert(0, os.path.dirname(__file__))
 
+import bmesh
 import bpy
-from models import Cylinder
+import numpy as np
 
 
-def draw_cylinder(cylinder: Cylinder) -> bpy.types.Object:
-    """Create a cylinder mesh in Blender from a Cylinder dataclass."""
+def draw_cylinder(cylinder) -> bpy.types.Object:
+    """Create a cylinder mesh in Blender from a ray cylinder.
+
+    `cylinder` needs name/radius/depth/location/rotation_quat attributes, as
+    on the tuples built by ray_to_cylinder.
+    """
     # Add cylinder primitive with specified parameters
     bpy.ops.mesh.primitive_cylinder_add(
         radius=cylinder.radius,
         depth=cylinder.depth,
         location=(cylinder.location.x, cylinder.location.y, cylinder.location.z),
-        rotation=(cylinder.rotation.x, cylinder.rotation.y, cylinder.rotation.z),
     )
 
     # Get reference to the newly created cylinder
     cyl_obj = bpy.context.active_object
     cyl_obj.name = cylinder.name
+    cyl_obj.rotation_mode = "QUATERNION"
+    cyl_obj.rotation_quaternion = cylinder.rotation_quat
 
     return cyl_obj
+
+
+def _unit_cylinder(segments: int = 32):
+    """Radius 1, depth 1 cylinder centred on the origin, as flat arrays.
+
+    Returns the (V, 3) vertices, the vertex index of every face corner in
+    face order, and the (F,) offset of each face's first corner. Faces have
+    different sizes (two n-gon caps, quad sides), so corners stay flat.
+    """
+    bm = bmesh.new()
+    bmesh.ops.create_cone(
+        bm, cap_ends=True, segments=segments, radius1=1.0, radius2=1.0, depth=1.0
+    )
+    bm.verts.index_update()
+    verts = np.array([v.co[:] for v in bm.verts])
+    sizes = [len(f.verts) for f in bm.faces]
+    loops = np.array([v.index for f in bm.faces for v in f.verts], dtype=np.int32)
+    bm.free()
+    loop_starts = np.concatenate([[0], np.cumsum(sizes[:-1])]).astype(np.int32)
+    return verts, loops, loop_starts
+
+
+def _quaternions_to_matrices(quats: np.ndarray) -> np.ndarray:
+    """(N, 4) unit (w, x, y, z) quaternions to (N, 3, 3) rotation matrices."""
+    w, x, y, z = quats.T
+    return np.stack(
+        [
+            np.stack(
+                [1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)], -1
+            ),
+            np.stack(
+                [2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)], -1
+            ),
+            np.stack(
+                [2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)], -1
+            ),
+        ],
+        axis=1,
+    )
+
+
+def draw_cylinders(cylinders, name: str = "rays") -> bpy.types.Object:
+    """Create a single mesh object holding every cylinder (see draw_cylinder).
+
+    Unlike calling draw_cylinder per cylinder, this runs no operators: all
+    geometry is built in NumPy and written through the bulk foreach_set API.
+    """
+    template, template_loops, template_starts = _unit_cylinder()
+    n_cyl, n_verts = len(cylinders), len(template)
+    n_loops, n_faces = len(template_loops), len(template_starts)
+
+    locations = np.array(
+        [(c.location.x, c.location.y, c.location.z) for c in cylinders]
+    ).reshape(-1, 3)
+    sizes = np.array([(c.radius, c.radius, c.depth) for c in cylinders]).reshape(-1, 3)
+
+    # (N, V, 3): scale the template per cylinder, rotate, then translate.
+    scaled = template[None, :, :] * sizes.reshape(-1, 1, 3)
+    quats = np.array([c.rotation_quat for c in cylinders]).reshape(-1, 4)
+    matrices = _quaternions_to_matrices(quats)
+    verts = np.einsum("nij,nvj->nvi", matrices, scaled) + locations[:, None, :]
+
+    # Each copy's corners index its own block of vertices, and each copy's
+    # faces start after the previous copy's corners.
+    loops = template_loops[None, :] + (np.arange(n_cyl) * n_verts)[:, None]
+    loop_starts = template_starts[None, :] + (np.arange(n_cyl) * n_loops)[:, None]
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(n_cyl * n_verts)
+    mesh.vertices.foreach_set("co", verts.astype(np.float32).ravel())
+    mesh.loops.add(n_cyl * n_loops)
+    mesh.loops.foreach_set("vertex_index", loops.astype(np.int32).ravel())
+    mesh.polygons.add(n_cyl * n_faces)
+    mesh.polygons.foreach_set("loop_start", loop_starts.astype(np.int32).ravel())
+    # Blender 4.x derives face sizes from loop_start; older versions need them.
+    if not mesh.polygons.bl_rna.properties["loop_total"].is_readonly:
+        loop_totals = np.diff(np.append(template_starts, n_loops)).astype(np.int32)
+        mesh.polygons.foreach_set("loop_total", np.tile(loop_totals, n_cyl))
+    mesh.update(calc_edges=True)
+
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.collection.objects.link(obj)
+    return obj
@@ -6,12 +6,13 @@ lens effects, and advanced materials.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Optional
 
 import mathutils
+import numpy as np
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Point:
     """3D point in space."""
 
@@ -25,7 +26,7 @@ class Point:
         return cls(vec.x, vec.y, vec.z)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Direction:
     """3D direction vector (normalized)."""
 
@@ -40,7 +41,7 @@ class Direction:
         return cls(normalized.x, normalized.y, normalized.z)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Color:
     """RGB color."""
 
@@ -49,12 +50,13 @@ class Color:
     z: float  # Blue
 
     def __init__(self, r: float, g: float, b: float):
-        self.x = r
-        self.y = g
-        self.z = b
+        # Frozen dataclasses block normal assignment, including in __init__.
+        object.__setattr__(self, "x", r)
+        object.__setattr__(self, "y", g)
+        object.__setattr__(self, "z", b)
 
 
-@dataclass
+@dataclass(slots=True)
 class Material:
     """Material properties for ray tracing."""
 
@@ -88,7 +90,7 @@ class Material:
     bump_strength: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Camera:
     """Camera properties."""
 
@@ -114,7 +116,7 @@ class Camera:
     clip_end: float = 100.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Light:
     """Light source properties."""
 
@@ -146,7 +148,7 @@ class Light:
     shadow_soft_size: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Sphere:
     """Sphere primitive."""
 
@@ -159,9 +161,11 @@ class Sphere:
     # Motion blur
     motion_blur: bool = False
     position_t1: Optional[Point] = None
+    matrix_t0: Optional[mathutils.Matrix] = None
+    matrix_t1: Optional[mathutils.Matrix] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Cube:
     """Cube primitive."""
 
@@ -174,22 +178,26 @@ class Cube:
     # Motion blur
     motion_blur: bool = False
     position_t1: Optional[Point] = None
+    matrix_t0: Optional[mathutils.Matrix] = None
+    matrix_t1: Optional[mathutils.Matrix] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Plane:
     """Plane primitive (defined by vertices)."""
 
     name: str
-    points: List[Point]
+    points: np.ndarray  # (N, 3) float32 world-space vertex positions
     material: Material
     visible: bool = True
     # Motion blur
     motion_blur: bool = False
     position_t1: Optional[Point] = None
+    matrix_t0: Optional[mathutils.Matrix] = None
+    matrix_t1: Optional[mathutils.Matrix] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Torus:
     """Torus primitive."""
 
@@ -204,9 +212,11 @@ class Torus:
     # Motion blur
     motion_blur: bool = False
     position_t1: Optional[Point] = None
+    matrix_t0: Optional[mathutils.Matrix] = None
+    matrix_t1: Optional[mathutils.Matrix] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Cylinder:
     """Cylinder primitive."""
 
@@ -221,9 +231,11 @@ class Cylinder:
     # Motion blur
     motion_blur: bool = False
     position_t1: Optional[Point] = None
+    matrix_t0: Optional[mathutils.Matrix] = None
+    matrix_t1: Optional[mathutils.Matrix] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Cone:
     """Cone primitive."""
 
@@ -238,4 +250,6 @@ class Cone:
     # Motion blur
     motion_blur: bool = False
     position_t1: Optional[Point] = None
+    matrix_t0: Optional[mathutils.Matrix] = None
+    matrix_t1: Optional[mathutils.Matrix] = None
 
@@ -1,107 +1,155 @@
-import dataclasses
 import math
 import os
+import re
 import sys
+from collections import namedtuple
 
 sys.path.insert(0, os.path.dirname(__file__))
 
 print(sys.path)
 
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
-from draw_objects import draw_cylinder
-from models import Cylinder, Direction, Point
+import numpy as np
 
+from draw_objects import draw_cylinders
+from models import Point
 
-@dataclasses.dataclass
-class Ray:
-    name: str
-    origin: Point
-    direction: Direction
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; Blender does not bundle it.
+    njit = None
 
+# Lightweight stand-in for models.Cylinder: the ray pipeline only needs what
+# the draw functions read, not a material, scale or motion data. The
+# orientation is a (w, x, y, z) quaternion taking +Z onto the ray direction.
+_CylTuple = namedtuple("_CylTuple", "name radius depth location rotation_quat")
 
-def parse_value(keyword, value: str):
-    if keyword == "name":
-        return value
-    elif keyword == "origin":
-        return Point(*(map(float, value.split(" ", maxsplit=3))))
-    elif keyword == "direction":
-        return Direction(*(map(float, value.split(" ", maxsplit=3))))
+# Below this many rays the NumPy path is faster than entering the JIT kernel.
+_JIT_MIN_RAYS = 4096
 
+if njit is not None:
 
-def read_txt_to_rays(filename: Path) -> List[Ray]:
-    rays = []
+    @njit(
+        "void(f8[:, ::1], f8[:, ::1], f8, f8[:, ::1], f8[:, ::1])",
+        parallel=True,
+        fastmath=True,
+        cache=True,
+    )
+    def _rays_to_cyl_geom(origins, dirs, half_depth, out_loc, out_quat):
+        for i in prange(origins.shape[0]):
+            dx, dy, dz = dirs[i, 0], dirs[i, 1], dirs[i, 2]
+            inv_mag = 1.0 / math.sqrt(dx * dx + dy * dy + dz * dz)
+            scale = inv_mag * half_depth
+            out_loc[i, 0] = origins[i, 0] + dx * scale
+            out_loc[i, 1] = origins[i, 1] + dy * scale
+            out_loc[i, 2] = origins[i, 2] + dz * scale
+
+            # Same half-angle form as _z_to_direction_quats.
+            w = 1.0 + dz * inv_mag
+            if w < 1e-12:
+                out_quat[i, 0] = 0.0
+                out_quat[i, 1] = 1.0
+                out_quat[i, 2] = 0.0
+            else:
+                qx = -dy * inv_mag
+                qy = dx * inv_mag
+                inv_norm = 1.0 / math.sqrt(w * w + qx * qx + qy * qy)
+                out_quat[i, 0] = w * inv_norm
+                out_quat[i, 1] = qx * inv_norm
+                out_quat[i, 2] = qy * inv_norm
+            out_quat[i, 3] = 0.0
+
+else:
+    _rays_to_cyl_geom = None
+
+
+# One ray record: a name line followed by its origin and direction lines.
+_RAY_RE = re.compile(
+    r"name[ \t]+(.*?)\s*\n"
+    r"\s*origin\s+(\S+)\s+(\S+)\s+(\S+)\s*\n"
+    r"\s*direction\s+(\S+)\s+(\S+)\s+(\S+)"
+)
+_RAY_DTYPE = [("name", object)] + [(f"f{i}", np.float64) for i in range(6)]
+
+
+def read_txt_to_rays(filename: Path) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Read a ray file into names and (N, 3) float64 origin/direction arrays."""
     with open(filename, "r") as file:
         keyword, count = file.readline().strip().split(" ", maxsplit=1)
         assert keyword == "ray"
-
-        for _ in range(int(count)):
-            ray_data = {}
-            for __ in range(3):
-                keyword, value = file.readline().strip().split(" ", maxsplit=1)
-                ray_data[keyword] = parse_value(keyword, value)
-
-            rays.append(Ray(**ray_data))
-
-    return rays
-
-
-def ray_to_cylinder(rays: List[Ray]) -> List[Cylinder]:
-    cylinders = []
-    for ray in rays:
-        # Get magnitude of direction vector
-        magnitude = ray.direction.mod()
-
-        # Handle zero-length direction vectors
-        if magnitude < 1e-10:
-            raise ValueError(f"Ray '{ray.name}' has zero-length direction vector")
-
-        # Calculate spherical coordinates with numerical stability
-        phi = math.atan2(ray.direction.y, ray.direction.x)
-
-        # Clamp to [-1, 1] to avoid numerical errors in acos
-        cos_theta = max(-1.0, min(1.0, ray.direction.z / magnitude))
-        theta = math.acos(cos_theta)
-
-        # Calculate cylinder location: offset by half depth along ray direction
-        # so cylinder starts at origin and extends in ray direction
-        depth = 100
-        half_depth = depth / 2
-        normalized_dir = Point(
-            ray.direction.x / magnitude,
-            ray.direction.y / magnitude,
-            ray.direction.z / magnitude,
-        )
-
-        location = Point(
-            ray.origin.x + normalized_dir.x * half_depth,
-            ray.origin.y + normalized_dir.y * half_depth,
-            ray.origin.z + normalized_dir.z * half_depth,
-        )
-
-        cylinders.append(
-            Cylinder(
-                name=ray.name,
-                radius=0.1,
-                depth=depth,
-                location=location,
-                rotation=Point(0.0, theta, phi),
-            ),
+        rays = np.fromregex(file, _RAY_RE, dtype=_RAY_DTYPE)
+    assert len(rays) == int(count)
+
+    origins = np.column_stack([rays["f0"], rays["f1"], rays["f2"]])
+    dirs = np.column_stack([rays["f3"], rays["f4"], rays["f5"]])
+    return rays["name"].tolist(), origins, dirs
+
+
+def _z_to_direction_quats(dx, dy, dz, magnitudes) -> np.ndarray:
+    """(N, 4) (w, x, y, z) quaternions rotating +Z onto each ray direction.
+
+    Uses the half-angle form normalize(1 + z.d, z x d), which needs no trig.
+    Directions pointing straight down get a 180 degree flip about X.
+    """
+    quats = np.zeros((len(dx), 4))
+    quats[:, 0] = 1.0 + dz / magnitudes
+    quats[:, 1] = -dy / magnitudes
+    quats[:, 2] = dx / magnitudes
+    down = quats[:, 0] < 1e-12
+    quats[down] = (0.0, 1.0, 0.0, 0.0)
+    quats /= np.sqrt(np.einsum("ij,ij->i", quats, quats))[:, None]
+    return quats
+
+
+def ray_to_cylinder(
+    names: List[str], origins: np.ndarray, dirs: np.ndarray
+) -> List[_CylTuple]:
+    # Get magnitude of each direction vector
+    dx, dy, dz = dirs.T
+    magnitudes = np.sqrt(dx * dx + dy * dy + dz * dz)
+
+    # Handle zero-length direction vectors
+    zero = np.flatnonzero(magnitudes < 1e-10)
+    if zero.size:
+        raise ValueError(f"Ray '{names[zero[0]]}' has zero-length direction vector")
+
+    depth = 100
+    half_depth = depth / 2
+
+    if _rays_to_cyl_geom is not None and len(names) >= _JIT_MIN_RAYS:
+        locations = np.empty((len(names), 3))
+        quats = np.empty((len(names), 4))
+        _rays_to_cyl_geom(
+            np.ascontiguousarray(origins),
+            np.ascontiguousarray(dirs),
+            half_depth,
+            locations,
+            quats,
         )
+    else:
+        # Calculate cylinder location: offset by half depth along ray direction
+        # so cylinder starts at origin and extends in ray direction. The
+        # normalization is folded into one per-ray scale factor.
+        scale = half_depth / magnitudes
+        locations = origins + dirs * scale[:, None]
+        quats = _z_to_direction_quats(dx, dy, dz, magnitudes)
 
-    return cylinders
+    return [
+        _CylTuple(name, 0.1, depth, Point(*location), tuple(q))
+        for name, location, q in zip(names, locations.tolist(), quats.tolist())
+    ]
 
 
 def main():
-    rays = read_txt_to_rays(
-    filename=Path(__file__).parent.parent / "data" / "gen_rays.txt"
+    names, origins, dirs = read_txt_to_rays(
+        filename=Path(__file__).parent.parent / "data" / "gen_rays.txt"
     )
-    print(rays)
+    print(names)
 
-    cylinders = ray_to_cylinder(rays)
-    for cylinder in cylinders:
-        draw_cylinder(cylinder)
+    cylinders = ray_to_cylinder(names, origins, dirs)
+    draw_cylinders(cylinders)
 
 
 if __name__ == "__main__":